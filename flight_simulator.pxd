@@ -0,0 +1,120 @@
+# Cython declarations for flight_simulator.py.
+# Build the typed extension in place with: python setup.py build_ext --inplace
+
+cimport cython
+
+
+# Mirrors of the record layout and codes in flight_simulator.py. As cpdef enums they are
+# C constants inside the compiled module and plain ints on the Python side.
+cpdef enum:
+    IDX_TIME = 0
+    IDX_DIST = 1
+    IDX_ALT = 2
+    IDX_SPD = 3
+    IDX_HDG = 4
+    IDX_THR = 5
+    IDX_PITCH = 6
+    IDX_BANK = 7
+    IDX_FLAPS = 8
+    IDX_SMOKE = 9
+    IDX_SCORE = 10
+    IDX_FLAGS = 11
+
+cpdef enum:
+    FLAG_ENG1 = 1 << 0
+    FLAG_ENG2 = 1 << 1
+    FLAG_FIRE = 1 << 2
+    FLAG_GEAR = 1 << 3
+    FLAG_MAYDAY = 1 << 4
+    FLAG_BOTTLE = 1 << 5
+    FLAG_OXY = 1 << 6
+    FLAG_OVER = 1 << 7
+    FLAG_LANDED = 1 << 8
+
+cpdef enum:
+    MSG_NONE = 0
+    MSG_OIL_PRESS = 1
+    MSG_ENG2_FIRE = 2
+    MSG_CABIN_SMOKE = 3
+    MSG_UNCONTAINED = 4
+    MSG_HEAVY_SMOKE = 5
+    MSG_LANDED = 6
+    MSG_CRASH_LANDING = 7
+    MSG_TERRAIN = 8
+    MSG_BOTTLE_DISCHARGED = 9
+    MSG_BOTTLE_USED = 10
+    MSG_NO_FIRE = 11
+    MSG_MAYDAY = 12
+    MSG_MAYDAY_ACTIVE = 13
+    MSG_ENG2_SHUTDOWN = 14
+    MSG_ENG2_ALREADY_OFF = 15
+
+cpdef enum:
+    _DEMO_LOG_COLS = 6
+
+
+cdef class FlightState:
+    cdef public object record
+    cdef public str message
+
+
+cpdef double clamp(double value, double low, double high) noexcept
+cpdef double norm_heading(double heading) noexcept
+cpdef double heading_delta(double current, double target) noexcept
+
+
+@cython.locals(
+    msg=int,
+    t=double,
+    flags=int,
+    score_delta=int,
+    engines_on=int,
+    gear=bint,
+    one_engine=bint,
+    no_engine=bint,
+    effective_thrust=double,
+    yaw_rate_dps=double,
+    accel=double,
+    climb_fpm=double,
+    off_course=double,
+    bearing_penalty=double,
+    closure_nm_s=double,
+    aligned=bint,
+    stable_speed=bint,
+    configured=bint,
+)
+cpdef int _step_core(double[::1] st, double dt, double airport_heading)
+
+@cython.locals(flags=int)
+cpdef int _fire_bottle_core(double[::1] st)
+
+@cython.locals(flags=int)
+cpdef int _declare_mayday_core(double[::1] st)
+
+@cython.locals(flags=int)
+cpdef int _shutdown_engine2_core(double[::1] st)
+
+
+@cython.locals(msg=int, rows=int, i=int, code=int, base=Py_ssize_t)
+cpdef tuple _run_demo_core(double[::1] st, int steps, double dt, double airport_heading, double[::1] log)
+
+
+cdef class SimulatorCore:
+    cdef public FlightState state
+    cdef public double airport_heading
+
+    @cython.locals(s=FlightState, msg=int)
+    cpdef step(self, double dt)
+
+    @cython.locals(s=FlightState)
+    cpdef command_fire_bottle(self)
+
+    @cython.locals(s=FlightState)
+    cpdef command_declare_mayday(self)
+
+    @cython.locals(s=FlightState)
+    cpdef command_shutdown_engine2(self)
+
+
+@cython.locals(s=FlightState, st=double[::1], flags=int)
+cpdef FlightState replay(SimulatorCore core, object ticks, double dt=*, bint verbose=*)
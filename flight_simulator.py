@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+# cython: language_level=3, cdivision=True, boundscheck=False, wraparound=False
 """Visual flight simulator with emergency scenario gameplay.
 
 This is a lightweight 2D simulator inspired by cockpit/attitude visuals.
@@ -9,55 +10,544 @@ real-time controls, instrumentation, and emergency handling in a visual window.
 from __future__ import annotations
 
 import argparse
+import array
 import math
-from dataclasses import dataclass
+import sys
+from typing import Callable, Final, Iterable
 
 try:
     import tkinter as tk
+    import tkinter.font as tkfont
 except Exception:  # pragma: no cover - environment-specific import
     tk = None
+    tkfont = None
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency for fleet mode
+    np = None
 
-@dataclass
-class FlightState:
-    time_s: float = 0.0
-    distance_nm: float = 60.0
-    altitude_ft: float = 12000.0
-    speed_kts: float = 240.0
-    heading_deg: float = 270.0
+try:
+    import cython
+except ImportError:  # pragma: no cover - Cython is only needed to build
+    from types import SimpleNamespace
 
-    throttle: float = 62.0
-    pitch_deg: float = 0.0
-    bank_deg: float = 0.0
-    flaps: int = 0
-    gear_down: bool = False
+    cython = SimpleNamespace(compiled=False)
 
-    engine1_on: bool = True
-    engine2_on: bool = True
-    engine2_fire: bool = False
-    smoke_level: float = 0.0
+COMPILED = cython.compiled
 
-    emergency_declared: bool = False
-    fire_bottle_used: bool = False
-    oxygen_on: bool = False
+try:
+    from numba import njit, prange
+    from numba.extending import register_jitable
+except Exception:  # pragma: no cover - optional JIT for fleet mode
+    njit = None
+    prange = range
+    register_jitable = None
+
+if COMPILED:
+    # Numba can only JIT Python bytecode; a Cython build is already native.
+    njit = None
+_STEP_JIT = njit is not None
+
+
+_WINDOW_TITLE: Final[str] = "Verbal Flight Simulator - Visual Emergency Mode"
+_CONTROLS_TEXT: Final[str] = (
+    "Controls: W/S throttle | Up/Down pitch | Left/Right bank | "
+    "F flaps | G gear | M mayday | E shutdown ENG2 | B fire bottle | O oxygen | Q quit"
+)
+_NO_TK_TEXT: Final[str] = "Tkinter is not available in this environment. Try: python3 flight_simulator.py --demo\n"
+_STATUS_FMT: Final[str] = "t={:5.1f}s alt={:7.0f}ft spd={:6.1f}kt dist={:5.2f}nm fire={} msg={}"
+_HUD_MAIN_FMT: Final[str] = "SPD {:03d}kt   ALT {:05d}ft   HDG {:03d}   DIST {:04.1f}nm{}"
+_HUD_CONFIG_FMT: Final[str] = "THR {:02d}%  PITCH {:+.1f}°  BANK {:+.1f}°  FLAPS {}  GEAR {}  O2 {}"
+# Largest horizon travel from the canvas centre: pitch is held to [-10, 15] deg at 10 px/deg.
+_HORIZON_PAD: Final[int] = 150
+
+# 0.1-degree sin/cos tables over [-360, 360] for the attitude display.
+# Index with int(round(deg * _TRIG_STEPS)) + _TRIG_ZERO.
+_DEG2RAD: Final[float] = math.pi / 180.0
+_TRIG_STEPS: Final[int] = 10
+_TRIG_ZERO: Final[int] = 360 * _TRIG_STEPS
+_SIN_LUT: Final[tuple[float, ...]] = tuple(
+    math.sin(i / _TRIG_STEPS * _DEG2RAD) for i in range(-_TRIG_ZERO, _TRIG_ZERO + 1)
+)
+_COS_LUT: Final[tuple[float, ...]] = tuple(
+    math.cos(i / _TRIG_STEPS * _DEG2RAD) for i in range(-_TRIG_ZERO, _TRIG_ZERO + 1)
+)
+
+
+# Packed float64 record layout backing FlightState; the step kernel works on it directly.
+# Booleans share one FLAG_* bitmask in the "flags" slot; message text stays a plain attribute.
+FIELDS: Final[tuple[str, ...]] = (
+    "time_s",
+    "distance_nm",
+    "altitude_ft",
+    "speed_kts",
+    "heading_deg",
+    "throttle",
+    "pitch_deg",
+    "bank_deg",
+    "flaps",
+    "smoke_level",
+    "score",
+    "flags",
+)
+FIELD_IDX: Final[dict[str, int]] = {name: i for i, name in enumerate(FIELDS)}
+N_FIELDS: Final[int] = len(FIELDS)
+# The record indices, FLAG_* bits, MSG_* codes and _DEMO_LOG_COLS are cpdef enums in
+# flight_simulator.pxd, so a Cython build sees C constants; interpreted runs assign them here.
+if not cython.compiled:
+    (
+        IDX_TIME,
+        IDX_DIST,
+        IDX_ALT,
+        IDX_SPD,
+        IDX_HDG,
+        IDX_THR,
+        IDX_PITCH,
+        IDX_BANK,
+        IDX_FLAPS,
+        IDX_SMOKE,
+        IDX_SCORE,
+        IDX_FLAGS,
+    ) = range(N_FIELDS)
+
+# Bits of record[IDX_FLAGS]. The slot holds a small integer, exact in float64.
+if not cython.compiled:
+    FLAG_ENG1: Final[int] = 1 << 0
+    FLAG_ENG2: Final[int] = 1 << 1
+    FLAG_FIRE: Final[int] = 1 << 2
+    FLAG_GEAR: Final[int] = 1 << 3
+    FLAG_MAYDAY: Final[int] = 1 << 4
+    FLAG_BOTTLE: Final[int] = 1 << 5
+    FLAG_OXY: Final[int] = 1 << 6
+    FLAG_OVER: Final[int] = 1 << 7
+    FLAG_LANDED: Final[int] = 1 << 8
+
+
+def _float_buffer(n: int):
+    """Zeroed float64 buffer for the record kernels.
+
+    An ndarray for Numba and array('d') for the typed ``double[::1]`` Cython build.
+    Plain interpreted runs keep a list, which hands back stored floats without
+    boxing a new one on every read.
+    """
+    if _STEP_JIT:
+        return np.zeros(n)
+    if COMPILED:
+        return array.array("d", bytes(8 * n))
+    return [0.0] * n
+
+
+class _Field:
+    """Exposes one slot of FlightState.record as a typed attribute."""
+
+    __slots__ = ("idx", "cast")
+
+    def __init__(self, idx: int, cast: type) -> None:
+        self.idx = idx
+        self.cast = cast
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return self.cast(obj.record[self.idx])
+
+    def __set__(self, obj, value) -> None:
+        obj.record[self.idx] = value
+
+
+class _Flag:
+    """Exposes one FLAG_* bit of FlightState.record as a bool attribute."""
+
+    __slots__ = ("bit",)
+
+    def __init__(self, bit: int) -> None:
+        self.bit = bit
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return bool(int(obj.record[IDX_FLAGS]) & self.bit)
+
+    def __set__(self, obj, value) -> None:
+        flags = int(obj.record[IDX_FLAGS])
+        obj.record[IDX_FLAGS] = flags | self.bit if value else flags & ~self.bit
+
+
+# FlightState's public attributes, in constructor order.
+_STATE_ATTRS: Final[tuple[str, ...]] = (
+    "time_s",
+    "distance_nm",
+    "altitude_ft",
+    "speed_kts",
+    "heading_deg",
+    "throttle",
+    "pitch_deg",
+    "bank_deg",
+    "flaps",
+    "gear_down",
+    "engine1_on",
+    "engine2_on",
+    "engine2_fire",
+    "smoke_level",
+    "emergency_declared",
+    "fire_bottle_used",
+    "oxygen_on",
+    "score",
+    "game_over",
+    "landed",
+    "message",
+)
 
-    score: int = 0
-    game_over: bool = False
-    landed: bool = False
-    message: str = ""
+
+class FlightState:
+    """Attribute view over a packed ``record`` the step kernel updates in place."""
+
+    time_s = _Field(IDX_TIME, float)
+    distance_nm = _Field(IDX_DIST, float)
+    altitude_ft = _Field(IDX_ALT, float)
+    speed_kts = _Field(IDX_SPD, float)
+    heading_deg = _Field(IDX_HDG, float)
+
+    throttle = _Field(IDX_THR, float)
+    pitch_deg = _Field(IDX_PITCH, float)
+    bank_deg = _Field(IDX_BANK, float)
+    flaps = _Field(IDX_FLAPS, int)
+    gear_down = _Flag(FLAG_GEAR)
+
+    engine1_on = _Flag(FLAG_ENG1)
+    engine2_on = _Flag(FLAG_ENG2)
+    engine2_fire = _Flag(FLAG_FIRE)
+    smoke_level = _Field(IDX_SMOKE, float)
+
+    emergency_declared = _Flag(FLAG_MAYDAY)
+    fire_bottle_used = _Flag(FLAG_BOTTLE)
+    oxygen_on = _Flag(FLAG_OXY)
+
+    score = _Field(IDX_SCORE, int)
+    game_over = _Flag(FLAG_OVER)
+    landed = _Flag(FLAG_LANDED)
+    flags = _Field(IDX_FLAGS, int)
+
+    def __init__(
+        self,
+        time_s: float = 0.0,
+        distance_nm: float = 60.0,
+        altitude_ft: float = 12000.0,
+        speed_kts: float = 240.0,
+        heading_deg: float = 270.0,
+        throttle: float = 62.0,
+        pitch_deg: float = 0.0,
+        bank_deg: float = 0.0,
+        flaps: int = 0,
+        gear_down: bool = False,
+        engine1_on: bool = True,
+        engine2_on: bool = True,
+        engine2_fire: bool = False,
+        smoke_level: float = 0.0,
+        emergency_declared: bool = False,
+        fire_bottle_used: bool = False,
+        oxygen_on: bool = False,
+        score: int = 0,
+        game_over: bool = False,
+        landed: bool = False,
+        message: str = "",
+    ) -> None:
+        self.record = _float_buffer(N_FIELDS)
+
+        self.time_s = time_s
+        self.distance_nm = distance_nm
+        self.altitude_ft = altitude_ft
+        self.speed_kts = speed_kts
+        self.heading_deg = heading_deg
+
+        self.throttle = throttle
+        self.pitch_deg = pitch_deg
+        self.bank_deg = bank_deg
+        self.flaps = flaps
+        self.gear_down = gear_down
+
+        self.engine1_on = engine1_on
+        self.engine2_on = engine2_on
+        self.engine2_fire = engine2_fire
+        self.smoke_level = smoke_level
+
+        self.emergency_declared = emergency_declared
+        self.fire_bottle_used = fire_bottle_used
+        self.oxygen_on = oxygen_on
+
+        self.score = score
+        self.game_over = game_over
+        self.landed = landed
+        self.message = message
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{name}={getattr(self, name)!r}" for name in _STATE_ATTRS)
+        return f"FlightState({args})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return list(self.record) == list(other.record) and self.message == other.message
 
 
 def clamp(value: float, low: float, high: float) -> float:
-    return max(low, min(high, value))
+    if value < low:
+        return low
+    if value > high:
+        return high
+    return value
 
 
 def norm_heading(heading: float) -> float:
-    x = heading % 360.0
-    return x if x > 0 else 360.0
+    # Headings move by far less than a turn per step, so one wrap replaces the modulo.
+    x = heading
+    if x > 360.0:
+        x -= 360.0
+    elif x <= 0.0:
+        x += 360.0
+    return x
 
 
 def heading_delta(current: float, target: float) -> float:
-    return (target - current + 540.0) % 360.0 - 180.0
+    # Both headings lie in (0, 360], so the raw difference is within one wrap of [-180, 180).
+    d = target - current
+    if d >= 180.0:
+        d -= 360.0
+    elif d < -180.0:
+        d += 360.0
+    return d
+
+
+if _STEP_JIT:
+    # Teach Numba to inline the helpers into the kernels. They stay plain functions, so
+    # Python callers are unaffected and a Cython build calls them as cpdef C functions.
+    register_jitable(inline="always")(clamp)
+    register_jitable(inline="always")(norm_heading)
+    register_jitable(inline="always")(heading_delta)
+
+
+# Cockpit messages produced by the record kernels, indexed by the MSG_* code
+# they return. MSG_NONE leaves the current message unchanged.
+_MESSAGES: Final[tuple[str, ...]] = (
+    "",
+    "ENG2 OIL PRESS LOW: smoke trail observed.",
+    "ENGINE 2 FIRE WARNING!",
+    "CABIN: smoke increasing. Descend + oxygen.",
+    "Uncontained engine failure. Flight lost.",
+    "Heavy smoke. Use oxygen and descend.",
+    "Safe emergency landing completed.",
+    "Crash landing: unstable approach.",
+    "Terrain impact.",
+    "Fire bottle discharged, warning extinguished.",
+    "Fire bottle already used.",
+    "No active engine fire.",
+    "MAYDAY declared. Direct to nearest airport.",
+    "MAYDAY already active.",
+    "Engine 2 shutdown complete.",
+    "Engine 2 already off.",
+)
+if not cython.compiled:
+    (
+        MSG_NONE,
+        MSG_OIL_PRESS,
+        MSG_ENG2_FIRE,
+        MSG_CABIN_SMOKE,
+        MSG_UNCONTAINED,
+        MSG_HEAVY_SMOKE,
+        MSG_LANDED,
+        MSG_CRASH_LANDING,
+        MSG_TERRAIN,
+        MSG_BOTTLE_DISCHARGED,
+        MSG_BOTTLE_USED,
+        MSG_NO_FIRE,
+        MSG_MAYDAY,
+        MSG_MAYDAY_ACTIVE,
+        MSG_ENG2_SHUTDOWN,
+        MSG_ENG2_ALREADY_OFF,
+    ) = range(len(_MESSAGES))
+
+
+def _step_core(st, dt: float, airport_heading: float) -> int:
+    """Numeric body of SimulatorCore.step on a packed record; returns a MSG_* code."""
+    msg = MSG_NONE
+    # Score changes are summed here and stored once on the way out.
+    score_delta = 0
+
+    st[IDX_TIME] += dt
+    t = st[IDX_TIME]
+    flags = int(st[IDX_FLAGS])
+
+    # Incident timeline
+    if 20.0 < t <= 20.2:
+        msg = MSG_OIL_PRESS
+        score_delta -= 2
+    if 50.0 < t <= 50.2 and flags & FLAG_ENG2:
+        flags |= FLAG_FIRE
+        st[IDX_SMOKE] = max(1.0, st[IDX_SMOKE])
+        msg = MSG_ENG2_FIRE
+    if 90.0 < t <= 90.2:
+        st[IDX_SMOKE] = max(1.0, st[IDX_SMOKE])
+        msg = MSG_CABIN_SMOKE
+
+    engines_on = (flags & FLAG_ENG1) + ((flags & FLAG_ENG2) >> 1)
+    gear = (flags & FLAG_GEAR) != 0
+
+    if flags & FLAG_FIRE:
+        st[IDX_SMOKE] = clamp(st[IDX_SMOKE] + 0.01 * dt * 60, 0.0, 2.0)
+        score_delta -= 1
+        if t > 180 and flags & FLAG_ENG2:
+            st[IDX_FLAGS] = flags | FLAG_OVER
+            st[IDX_SCORE] += score_delta
+            return MSG_UNCONTAINED
+
+    # Engine/flap/gear penalties as arithmetic on 0/1 values rather than branches.
+    one_engine = engines_on == 1
+    no_engine = engines_on == 0
+    effective_thrust = (
+        st[IDX_THR] * (not no_engine) - 18 * one_engine - st[IDX_FLAPS] * 4 - 10 * gear
+    )
+
+    # Turn dynamics from bank
+    yaw_rate_dps = st[IDX_BANK] * 0.07
+    st[IDX_HDG] = norm_heading(st[IDX_HDG] + yaw_rate_dps * dt)
+
+    # Speed dynamics
+    accel = (effective_thrust - 52) * 0.04 - abs(st[IDX_BANK]) * 0.02 - st[IDX_PITCH] * 0.05
+    st[IDX_SPD] = clamp(st[IDX_SPD] + accel * dt, 110.0, 360.0)
+
+    # Vertical dynamics
+    climb_fpm = (
+        st[IDX_PITCH] * 700
+        + (st[IDX_THR] - 55) * 18
+        - 700 * one_engine
+        - 2500 * no_engine
+        - 400 * (st[IDX_FLAPS] >= 2)
+        - 500 * gear
+    )
+    st[IDX_ALT] = clamp(st[IDX_ALT] + (climb_fpm / 60.0) * dt, 0.0, 41000.0)
+
+    # Distance closure
+    off_course = abs(heading_delta(st[IDX_HDG], airport_heading))
+    bearing_penalty = off_course / 120.0
+    closure_nm_s = max(0.003, (st[IDX_SPD] / 3600.0) - bearing_penalty * 0.01)
+    st[IDX_DIST] = max(0.0, st[IDX_DIST] - closure_nm_s * dt)
+
+    # Smoke effects
+    if st[IDX_SMOKE] > 1.2 and not flags & FLAG_OXY:
+        score_delta -= 1
+        if st[IDX_ALT] > 10000:
+            msg = MSG_HEAVY_SMOKE
+
+    # Landing and crash checks
+    if st[IDX_DIST] <= 0.25 and st[IDX_ALT] <= 60:
+        flags |= FLAG_OVER
+        aligned = off_course <= 20
+        stable_speed = 120 <= st[IDX_SPD] <= 165
+        configured = gear and st[IDX_FLAPS] >= 2
+        if aligned and stable_speed and configured:
+            flags |= FLAG_LANDED
+            score_delta += 30
+            msg = MSG_LANDED
+        else:
+            score_delta -= 30
+            msg = MSG_CRASH_LANDING
+    elif st[IDX_ALT] <= 0 and not flags & FLAG_LANDED:
+        flags |= FLAG_OVER
+        msg = MSG_TERRAIN
+    st[IDX_FLAGS] = flags
+    st[IDX_SCORE] += score_delta
+    return msg
+
+
+def _fire_bottle_core(st) -> int:
+    flags = int(st[IDX_FLAGS])
+    if flags & (FLAG_FIRE | FLAG_BOTTLE) == FLAG_FIRE:
+        st[IDX_FLAGS] = flags ^ (FLAG_FIRE | FLAG_BOTTLE)
+        st[IDX_SCORE] += 12
+        return MSG_BOTTLE_DISCHARGED
+    if flags & FLAG_BOTTLE:
+        return MSG_BOTTLE_USED
+    return MSG_NO_FIRE
+
+
+def _declare_mayday_core(st) -> int:
+    flags = int(st[IDX_FLAGS])
+    if not flags & FLAG_MAYDAY:
+        st[IDX_FLAGS] = flags | FLAG_MAYDAY
+        st[IDX_SCORE] += 8
+        return MSG_MAYDAY
+    return MSG_MAYDAY_ACTIVE
+
+
+def _shutdown_engine2_core(st) -> int:
+    flags = int(st[IDX_FLAGS])
+    if flags & FLAG_ENG2:
+        st[IDX_FLAGS] = flags ^ FLAG_ENG2
+        st[IDX_SCORE] += 6
+        return MSG_ENG2_SHUTDOWN
+    return MSG_ENG2_ALREADY_OFF
+
+
+if not cython.compiled:
+    _DEMO_LOG_COLS: Final[int] = 6
+
+
+def _run_demo_core(st, steps, dt: float, airport_heading: float, log) -> tuple[int, int]:
+    """Autopilot trajectory for run_text_demo on a packed record.
+
+    Every 20th tick appends (time, altitude, speed, distance, fire, message code)
+    to the flat ``log``. Returns the number of rows logged and the final message code.
+    """
+    msg = MSG_NONE
+    rows = 0
+    for i in range(steps):
+        if st[IDX_TIME] > 52 and int(st[IDX_FLAGS]) & FLAG_ENG2:
+            _shutdown_engine2_core(st)
+            msg = _fire_bottle_core(st)
+        if st[IDX_ALT] > 3000:
+            st[IDX_PITCH] = -4.0
+            st[IDX_THR] = 50.0
+        else:
+            st[IDX_PITCH] = -1.0
+            st[IDX_THR] = 45.0
+            st[IDX_FLAPS] = 2.0
+            st[IDX_FLAGS] = int(st[IDX_FLAGS]) | FLAG_GEAR
+        code = _step_core(st, dt, airport_heading)
+        if code:
+            msg = code
+        if int(st[IDX_FLAGS]) & FLAG_OVER:
+            break
+        if i % 20 == 0:
+            base = rows * _DEMO_LOG_COLS
+            log[base] = st[IDX_TIME]
+            log[base + 1] = st[IDX_ALT]
+            log[base + 2] = st[IDX_SPD]
+            log[base + 3] = st[IDX_DIST]
+            log[base + 4] = (int(st[IDX_FLAGS]) & FLAG_FIRE) != 0
+            log[base + 5] = msg
+            rows += 1
+    return rows, msg
+
+
+def _kernel(fn):
+    """Compile a record kernel with Numba when available; otherwise return it as-is.
+
+    The physics coefficients are written as literals in the kernel bodies, so Numba
+    (and Cython, on the typed locals) folds them into the compiled code; there is no
+    per-profile state to specialize on at runtime.
+    """
+    return njit(cache=True)(fn) if _STEP_JIT else fn
+
+
+if _STEP_JIT:
+    # Lets _run_demo_core call the kernels by name, which a Cython build binds as C calls.
+    register_jitable(_step_core)
+    register_jitable(_fire_bottle_core)
+    register_jitable(_shutdown_engine2_core)
+
+_step_core_jit = _kernel(_step_core)
+_run_demo_jit = _kernel(_run_demo_core)
 
 
 class SimulatorCore:
@@ -65,122 +555,343 @@ class SimulatorCore:
         self.state = FlightState()
         self.airport_heading = 270.0
 
-    def incident_logic(self) -> None:
-        s = self.state
-        t = s.time_s
-        if 20.0 < t <= 20.2:
-            s.message = "ENG2 OIL PRESS LOW: smoke trail observed."
-            s.score -= 2
-        if 50.0 < t <= 50.2 and s.engine2_on:
-            s.engine2_fire = True
-            s.smoke_level = max(1.0, s.smoke_level)
-            s.message = "ENGINE 2 FIRE WARNING!"
-        if 90.0 < t <= 90.2:
-            s.smoke_level = max(1.0, s.smoke_level)
-            s.message = "CABIN: smoke increasing. Descend + oxygen."
-
     def step(self, dt: float) -> None:
         s = self.state
-        if s.game_over:
+        st = s.record
+        if int(st[IDX_FLAGS]) & FLAG_OVER:
             return
 
-        s.time_s += dt
-        self.incident_logic()
-
-        engines_on = int(s.engine1_on) + int(s.engine2_on)
-
-        if s.engine2_fire:
-            s.smoke_level = clamp(s.smoke_level + 0.01 * dt * 60, 0.0, 2.0)
-            s.score -= 1
-            if s.time_s > 180 and s.engine2_on:
-                s.game_over = True
-                s.message = "Uncontained engine failure. Flight lost."
-                return
-
-        effective_thrust = s.throttle
-        if engines_on == 1:
-            effective_thrust -= 18
-        elif engines_on == 0:
-            effective_thrust = 0
-
-        effective_thrust -= s.flaps * 4
-        if s.gear_down:
-            effective_thrust -= 10
-
-        # Turn dynamics from bank
-        yaw_rate_dps = s.bank_deg * 0.07
-        s.heading_deg = norm_heading(s.heading_deg + yaw_rate_dps * dt)
-
-        # Speed dynamics
-        accel = (effective_thrust - 52) * 0.04 - abs(s.bank_deg) * 0.02 - s.pitch_deg * 0.05
-        s.speed_kts = clamp(s.speed_kts + accel * dt, 110, 360)
-
-        # Vertical dynamics
-        climb_fpm = s.pitch_deg * 700 + (s.throttle - 55) * 18
-        if engines_on == 1:
-            climb_fpm -= 700
-        if engines_on == 0:
-            climb_fpm -= 2500
-        if s.flaps >= 2:
-            climb_fpm -= 400
-        if s.gear_down:
-            climb_fpm -= 500
-        s.altitude_ft = clamp(s.altitude_ft + (climb_fpm / 60.0) * dt, 0, 41000)
-
-        # Distance closure
-        bearing_penalty = abs(heading_delta(s.heading_deg, self.airport_heading)) / 120.0
-        closure_nm_s = max(0.003, (s.speed_kts / 3600.0) - bearing_penalty * 0.01)
-        s.distance_nm = max(0.0, s.distance_nm - closure_nm_s * dt)
-
-        # Smoke effects
-        if s.smoke_level > 1.2 and not s.oxygen_on:
-            s.score -= 1
-            if s.altitude_ft > 10000:
-                s.message = "Heavy smoke. Use oxygen and descend."
-
-        # Landing and crash checks
-        if s.distance_nm <= 0.25 and s.altitude_ft <= 60:
-            self.evaluate_landing()
-        elif s.altitude_ft <= 0 and not s.landed:
-            s.game_over = True
-            s.message = "Terrain impact."
-
-    def evaluate_landing(self) -> None:
-        s = self.state
-        aligned = abs(heading_delta(s.heading_deg, self.airport_heading)) <= 20
-        stable_speed = 120 <= s.speed_kts <= 165
-        configured = s.gear_down and s.flaps >= 2
-
-        if aligned and stable_speed and configured:
-            s.landed = True
-            s.game_over = True
-            s.score += 30
-            s.message = "Safe emergency landing completed."
+        # Calling _step_core by name lets a Cython build bind it as a direct C call.
+        if _STEP_JIT:
+            msg = _step_core_jit(st, dt, self.airport_heading)
         else:
-            s.game_over = True
-            s.score -= 30
-            s.message = "Crash landing: unstable approach."
+            msg = _step_core(st, dt, self.airport_heading)
+        if msg:
+            s.message = _MESSAGES[msg]
 
     def command_fire_bottle(self) -> None:
         s = self.state
-        if s.engine2_fire and not s.fire_bottle_used:
-            s.engine2_fire = False
-            s.fire_bottle_used = True
-            s.score += 12
-            s.message = "Fire bottle discharged, warning extinguished."
-        elif s.fire_bottle_used:
-            s.message = "Fire bottle already used."
-        else:
-            s.message = "No active engine fire."
+        s.message = _MESSAGES[_fire_bottle_core(s.record)]
+
+    def command_declare_mayday(self) -> None:
+        s = self.state
+        s.message = _MESSAGES[_declare_mayday_core(s.record)]
 
     def command_shutdown_engine2(self) -> None:
         s = self.state
-        if s.engine2_on:
-            s.engine2_on = False
-            s.score += 6
-            s.message = "Engine 2 shutdown complete."
-        else:
-            s.message = "Engine 2 already off."
+        s.message = _MESSAGES[_shutdown_engine2_core(s.record)]
+
+
+class FleetState:
+    """Structure-of-arrays state for advancing many flights in lockstep.
+
+    Holds one array per FlightState attribute named in ``_COLUMNS``; every attribute
+    except ``message`` is carried, so per-flight messages are dropped on conversion.
+    """
+
+    _COLUMNS: Final[tuple[str, ...]] = _STATE_ATTRS[:-1]
+
+    def __init__(self, n: int) -> None:
+        if np is None:
+            raise RuntimeError("NumPy is required for fleet simulation.")
+        d = FlightState()
+        self.n = n
+        self.time_s = np.full(n, d.time_s)
+        self.distance_nm = np.full(n, d.distance_nm)
+        self.altitude_ft = np.full(n, d.altitude_ft)
+        self.speed_kts = np.full(n, d.speed_kts)
+        self.heading_deg = np.full(n, d.heading_deg)
+
+        self.throttle = np.full(n, d.throttle)
+        self.pitch_deg = np.full(n, d.pitch_deg)
+        self.bank_deg = np.full(n, d.bank_deg)
+        self.flaps = np.full(n, d.flaps, dtype=np.int8)
+        self.gear_down = np.full(n, d.gear_down, dtype=np.bool_)
+
+        self.engine1_on = np.full(n, d.engine1_on, dtype=np.bool_)
+        self.engine2_on = np.full(n, d.engine2_on, dtype=np.bool_)
+        self.engine2_fire = np.full(n, d.engine2_fire, dtype=np.bool_)
+        self.smoke_level = np.full(n, d.smoke_level)
+
+        self.emergency_declared = np.full(n, d.emergency_declared, dtype=np.bool_)
+        self.fire_bottle_used = np.full(n, d.fire_bottle_used, dtype=np.bool_)
+        self.oxygen_on = np.full(n, d.oxygen_on, dtype=np.bool_)
+
+        self.score = np.full(n, d.score, dtype=np.int32)
+        self.game_over = np.full(n, d.game_over, dtype=np.bool_)
+        self.landed = np.full(n, d.landed, dtype=np.bool_)
+
+    @classmethod
+    def from_states(cls, states: list[FlightState]) -> FleetState:
+        fleet = cls(len(states))
+        for name in cls._COLUMNS:
+            getattr(fleet, name)[:] = [getattr(s, name) for s in states]
+        return fleet
+
+    def state(self, i: int) -> FlightState:
+        s = FlightState()
+        for name in self._COLUMNS:
+            setattr(s, name, getattr(self, name)[i].item())
+        return s
+
+
+def _step_fleet_numpy(f: FleetState, dt: float, airport_heading: float) -> None:
+    active = ~f.game_over
+    f.time_s += dt * active
+    t = f.time_s
+
+    # Incident timeline
+    f.score -= 2 * (active & (t > 20.0) & (t <= 20.2))
+    ignite = active & (t > 50.0) & (t <= 50.2) & f.engine2_on
+    f.engine2_fire |= ignite
+    cabin = active & (t > 90.0) & (t <= 90.2)
+    f.smoke_level = np.where(ignite | cabin, np.maximum(1.0, f.smoke_level), f.smoke_level)
+
+    engines_on = f.engine1_on.astype(np.int8) + f.engine2_on
+
+    burning = active & f.engine2_fire
+    f.smoke_level = np.where(burning, np.clip(f.smoke_level + 0.01 * dt * 60, 0.0, 2.0), f.smoke_level)
+    f.score -= burning
+    lost = burning & (t > 180) & f.engine2_on
+    f.game_over |= lost
+    moving = active & ~lost
+
+    effective_thrust = np.where(engines_on == 0, 0.0, f.throttle - 18 * (engines_on == 1))
+    effective_thrust = effective_thrust - f.flaps * 4 - f.gear_down * 10
+
+    # Turn dynamics from bank
+    heading = (f.heading_deg + f.bank_deg * 0.07 * dt) % 360.0
+    f.heading_deg = np.where(moving, np.where(heading > 0, heading, 360.0), f.heading_deg)
+
+    # Speed dynamics
+    accel = (effective_thrust - 52) * 0.04 - np.abs(f.bank_deg) * 0.02 - f.pitch_deg * 0.05
+    f.speed_kts = np.where(moving, np.clip(f.speed_kts + accel * dt, 110, 360), f.speed_kts)
+
+    # Vertical dynamics
+    climb_fpm = (
+        f.pitch_deg * 700
+        + (f.throttle - 55) * 18
+        - 700 * (engines_on == 1)
+        - 2500 * (engines_on == 0)
+        - 400 * (f.flaps >= 2)
+        - 500 * f.gear_down
+    )
+    f.altitude_ft = np.where(moving, np.clip(f.altitude_ft + (climb_fpm / 60.0) * dt, 0, 41000), f.altitude_ft)
+
+    # Distance closure
+    off_course = np.abs((airport_heading - f.heading_deg + 540.0) % 360.0 - 180.0)
+    closure_nm_s = np.maximum(0.003, (f.speed_kts / 3600.0) - off_course / 120.0 * 0.01)
+    f.distance_nm = np.where(moving, np.maximum(0.0, f.distance_nm - closure_nm_s * dt), f.distance_nm)
+
+    # Smoke effects
+    f.score -= moving & (f.smoke_level > 1.2) & ~f.oxygen_on
+
+    # Landing and crash checks
+    at_field = moving & (f.distance_nm <= 0.25) & (f.altitude_ft <= 60)
+    stable = (
+        (off_course <= 20)
+        & (f.speed_kts >= 120)
+        & (f.speed_kts <= 165)
+        & f.gear_down
+        & (f.flaps >= 2)
+    )
+    f.landed |= at_field & stable
+    f.score += 30 * (at_field & stable) - 30 * (at_field & ~stable)
+    f.game_over |= at_field | (moving & (f.altitude_ft <= 0) & ~f.landed)
+
+
+def _step_fleet(
+    time_s, distance_nm, altitude_ft, speed_kts, heading_deg, throttle, pitch_deg, bank_deg,
+    flaps, gear_down, engine1_on, engine2_on, engine2_fire, smoke_level, oxygen_on,
+    score, game_over, landed, dt, airport_heading,
+):
+    # Fused per-flight loop over the FleetState columns, updated in place.
+    for i in prange(time_s.shape[0]):
+        if game_over[i]:
+            continue
+
+        t = time_s[i] + dt
+        time_s[i] = t
+        score_delta = 0
+        if 20.0 < t <= 20.2:
+            score_delta -= 2
+        if 50.0 < t <= 50.2 and engine2_on[i]:
+            engine2_fire[i] = True
+            smoke_level[i] = max(1.0, smoke_level[i])
+        if 90.0 < t <= 90.2:
+            smoke_level[i] = max(1.0, smoke_level[i])
+
+        engines_on = int(engine1_on[i]) + int(engine2_on[i])
+
+        if engine2_fire[i]:
+            smoke_level[i] = clamp(smoke_level[i] + 0.01 * dt * 60, 0.0, 2.0)
+            score_delta -= 1
+            if t > 180 and engine2_on[i]:
+                game_over[i] = True
+                score[i] += score_delta
+                continue
+
+        one_engine = engines_on == 1
+        no_engine = engines_on == 0
+        gear = gear_down[i]
+        effective_thrust = throttle[i] * (not no_engine) - 18 * one_engine - flaps[i] * 4 - 10 * gear
+
+        bank = bank_deg[i]
+        heading = norm_heading(heading_deg[i] + bank * 0.07 * dt)
+        heading_deg[i] = heading
+
+        accel = (effective_thrust - 52) * 0.04 - abs(bank) * 0.02 - pitch_deg[i] * 0.05
+        speed = clamp(speed_kts[i] + accel * dt, 110, 360)
+        speed_kts[i] = speed
+
+        climb_fpm = (
+            pitch_deg[i] * 700
+            + (throttle[i] - 55) * 18
+            - 700 * one_engine
+            - 2500 * no_engine
+            - 400 * (flaps[i] >= 2)
+            - 500 * gear
+        )
+        altitude = clamp(altitude_ft[i] + (climb_fpm / 60.0) * dt, 0, 41000)
+        altitude_ft[i] = altitude
+
+        off_course = abs(heading_delta(heading, airport_heading))
+        closure_nm_s = max(0.003, (speed / 3600.0) - off_course / 120.0 * 0.01)
+        distance = max(0.0, distance_nm[i] - closure_nm_s * dt)
+        distance_nm[i] = distance
+
+        if smoke_level[i] > 1.2 and not oxygen_on[i]:
+            score_delta -= 1
+
+        if distance <= 0.25 and altitude <= 60:
+            game_over[i] = True
+            if off_course <= 20 and 120 <= speed <= 165 and gear_down[i] and flaps[i] >= 2:
+                landed[i] = True
+                score_delta += 30
+            else:
+                score_delta -= 30
+        elif altitude <= 0:
+            game_over[i] = True
+        score[i] += score_delta
+
+
+if njit is not None:
+    _step_fleet = njit(parallel=True, cache=True)(_step_fleet)
+
+
+def step_fleet(f: FleetState, dt: float, airport_heading: float = 270.0) -> None:
+    """Vectorized SimulatorCore.step: advance every flight in ``f`` by ``dt``.
+
+    Uses the fused Numba kernel when available, NumPy array passes otherwise.
+    Messages are not tracked per flight; only the numeric state and score are.
+    """
+    if njit is None:
+        _step_fleet_numpy(f, dt, airport_heading)
+        return
+    _step_fleet(
+        f.time_s, f.distance_nm, f.altitude_ft, f.speed_kts, f.heading_deg,
+        f.throttle, f.pitch_deg, f.bank_deg, f.flaps, f.gear_down,
+        f.engine1_on, f.engine2_on, f.engine2_fire, f.smoke_level, f.oxygen_on,
+        f.score, f.game_over, f.landed, dt, airport_heading,
+    )
+
+
+def warm_fleet_kernel() -> None:
+    """Compile (or load from Numba's cache) the fused fleet kernel ahead of time.
+
+    step_fleet does this on first use anyway; call it before a timed batch so the first
+    step does not absorb the cost. A no-op without Numba.
+    """
+    if njit is not None:
+        step_fleet(FleetState(1), 0.1)
+
+
+def _throttle_up(core: SimulatorCore) -> None:
+    st = core.state.record
+    st[IDX_THR] = clamp(st[IDX_THR] + 3, 0, 100)
+
+
+def _throttle_down(core: SimulatorCore) -> None:
+    st = core.state.record
+    st[IDX_THR] = clamp(st[IDX_THR] - 3, 0, 100)
+
+
+def _pitch_up(core: SimulatorCore) -> None:
+    st = core.state.record
+    st[IDX_PITCH] = clamp(st[IDX_PITCH] + 1, -10, 15)
+
+
+def _pitch_down(core: SimulatorCore) -> None:
+    st = core.state.record
+    st[IDX_PITCH] = clamp(st[IDX_PITCH] - 1, -10, 15)
+
+
+def _bank_left(core: SimulatorCore) -> None:
+    st = core.state.record
+    st[IDX_BANK] = clamp(st[IDX_BANK] - 3, -35, 35)
+
+
+def _bank_right(core: SimulatorCore) -> None:
+    st = core.state.record
+    st[IDX_BANK] = clamp(st[IDX_BANK] + 3, -35, 35)
+
+
+def _dampen(core: SimulatorCore) -> None:
+    st = core.state.record
+    st[IDX_BANK] *= 0.5
+    st[IDX_PITCH] *= 0.8
+
+
+def _cycle_flaps(core: SimulatorCore) -> None:
+    st = core.state.record
+    st[IDX_FLAPS] = (int(st[IDX_FLAPS]) + 1) % 4
+
+
+def _toggle_gear(core: SimulatorCore) -> None:
+    st = core.state.record
+    st[IDX_FLAGS] = int(st[IDX_FLAGS]) ^ FLAG_GEAR
+
+
+def _toggle_oxygen(core: SimulatorCore) -> None:
+    s = core.state
+    st = s.record
+    flags = int(st[IDX_FLAGS]) ^ FLAG_OXY
+    st[IDX_FLAGS] = flags
+    s.message = f"Oxygen {'ON' if flags & FLAG_OXY else 'OFF'}."
+
+
+def _declare_mayday(core: SimulatorCore) -> None:
+    core.command_declare_mayday()
+
+
+def _shutdown_engine2(core: SimulatorCore) -> None:
+    core.command_shutdown_engine2()
+
+
+def _fire_bottle(core: SimulatorCore) -> None:
+    core.command_fire_bottle()
+
+
+# Lower-cased Tk keysym -> control handler. "q" is handled by the window itself.
+_KEY_HANDLERS: dict[str, Callable[[SimulatorCore], None]] = {
+    "w": _throttle_up,
+    "s": _throttle_down,
+    "up": _pitch_up,
+    "down": _pitch_down,
+    "left": _bank_left,
+    "right": _bank_right,
+    "space": _dampen,
+    "f": _cycle_flaps,
+    "g": _toggle_gear,
+    "m": _declare_mayday,
+    "e": _shutdown_engine2,
+    "b": _fire_bottle,
+    "o": _toggle_oxygen,
+}
+
+
+# The FLAG_* bits draw() reads; other bits never change the frame.
+_HUD_FLAGS: Final[int] = FLAG_GEAR | FLAG_FIRE | FLAG_OXY | FLAG_OVER | FLAG_LANDED
 
 
 class VisualFlightSim:
@@ -189,67 +900,67 @@ class VisualFlightSim:
         self.core = SimulatorCore()
         self.state = self.core.state
 
-        self.root.title("Verbal Flight Simulator - Visual Emergency Mode")
+        self.root.title(_WINDOW_TITLE)
         self.canvas = tk.Canvas(root, width=1024, height=640, bg="#10151d")
         self.canvas.pack(fill="both", expand=True)
 
         self.root.bind("<KeyPress>", self.on_key)
+        self.canvas.bind("<Configure>", self._on_resize)
         self.running = True
-
-        self.info = (
-            "Controls: W/S throttle | Up/Down pitch | Left/Right bank | "
-            "F flaps | G gear | M mayday | E shutdown ENG2 | B fire bottle | O oxygen | Q quit"
+        self.dirty = True
+        # Canvas size, refreshed from <Configure> instead of queried every frame.
+        self._w = 1024
+        self._h = 640
+        self._last_hud_tuple: tuple | None = None
+
+        # Fonts are resolved once here; passing tuples would make Tk re-parse them per item.
+        self.font_hud = tkfont.Font(root, family="Consolas", size=14, weight="bold")
+        self.font_config = tkfont.Font(root, family="Consolas", size=12)
+        self.font_small = tkfont.Font(root, family="Consolas", size=11)
+        self.font_overlay = tkfont.Font(root, family="Consolas", size=30, weight="bold")
+        self.font_score = tkfont.Font(root, family="Consolas", size=16)
+
+        # Persistent items, created once in stacking order and moved/retexted by draw().
+        c = self.canvas
+        self._horizon_img = self._render_horizon(self._w, self._h)
+        self.horizon_img_id = c.create_image(0, 0, anchor="nw", image=self._horizon_img)
+        self.horizon_id = c.create_line(0, 0, 0, 0, fill="white", width=3)
+        self.runway_id = c.create_polygon(
+            0, 0, 0, 0, 0, 0, 0, 0, fill="#2f2f2f", outline="white", state="hidden"
         )
+        self._runway_shown = False
+        self.cross_h_id = c.create_line(0, 0, 0, 0, fill="#00ff66", width=3)
+        self.cross_v_id = c.create_line(0, 0, 0, 0, fill="#00ff66", width=3)
+        self.hud_main_id = c.create_text(15, 15, anchor="nw", fill="white", font=self.font_hud)
+        self.hud_config_id = c.create_text(15, 42, anchor="nw", fill="#d7f0ff", font=self.font_config)
+        self.controls_id = c.create_text(
+            15, 0, anchor="nw", fill="#9cc0d8", font=self.font_small, text=_CONTROLS_TEXT
+        )
+        self.message_id = c.create_text(15, 0, anchor="nw", fill="#fff7a8", font=self.font_small)
+        self._layout()
 
         self.loop()
 
     def on_key(self, event: tk.Event) -> None:
         k = event.keysym.lower()
-        s = self.state
-
-        if k == "w":
-            s.throttle = clamp(s.throttle + 3, 0, 100)
-        elif k == "s":
-            s.throttle = clamp(s.throttle - 3, 0, 100)
-        elif k == "up":
-            s.pitch_deg = clamp(s.pitch_deg + 1, -10, 15)
-        elif k == "down":
-            s.pitch_deg = clamp(s.pitch_deg - 1, -10, 15)
-        elif k == "left":
-            s.bank_deg = clamp(s.bank_deg - 3, -35, 35)
-        elif k == "right":
-            s.bank_deg = clamp(s.bank_deg + 3, -35, 35)
-        elif k == "space":
-            s.bank_deg *= 0.5
-            s.pitch_deg *= 0.8
-        elif k == "f":
-            s.flaps = (s.flaps + 1) % 4
-        elif k == "g":
-            s.gear_down = not s.gear_down
-        elif k == "m":
-            if not s.emergency_declared:
-                s.emergency_declared = True
-                s.score += 8
-                s.message = "MAYDAY declared. Direct to nearest airport."
-            else:
-                s.message = "MAYDAY already active."
-        elif k == "e":
-            self.core.command_shutdown_engine2()
-        elif k == "b":
-            self.core.command_fire_bottle()
-        elif k == "o":
-            s.oxygen_on = not s.oxygen_on
-            s.message = f"Oxygen {'ON' if s.oxygen_on else 'OFF'}."
-        elif k == "q":
+        if k == "q":
             self.running = False
             self.root.destroy()
+            return
+
+        handler = _KEY_HANDLERS.get(k)
+        if handler is not None:
+            handler(self.core)
 
     def draw(self) -> None:
         c = self.canvas
         s = self.state
-        w = int(c.winfo_width())
-        h = int(c.winfo_height())
-        c.delete("all")
+        # Bound-method locals: draw() issues these several times per frame.
+        coords = c.coords
+        itemconfig = c.itemconfig
+        w = self._w
+        h = self._h
+        c.delete("transient")
 
         cx = w // 2
         cy = h // 2
@@ -257,24 +968,23 @@ class VisualFlightSim:
         # Sky/ground artificial horizon
         horizon_offset = int(s.pitch_deg * 10)
         horizon_y = cy + horizon_offset
-        sky_color = "#4b87d8"
-        ground_color = "#6b4f2f"
-        c.create_rectangle(0, 0, w, horizon_y, fill=sky_color, outline="")
-        c.create_rectangle(0, horizon_y, w, h, fill=ground_color, outline="")
+        coords(self.horizon_img_id, 0, horizon_y - h - _HORIZON_PAD)
 
         # Banked horizon line
-        bank_rad = math.radians(s.bank_deg)
+        bank_idx = int(round(s.bank_deg * _TRIG_STEPS)) + _TRIG_ZERO
         line_len = 1400
-        dx = math.cos(bank_rad) * line_len
-        dy = math.sin(bank_rad) * line_len
-        c.create_line(cx - dx, horizon_y - dy, cx + dx, horizon_y + dy, fill="white", width=3)
+        dx = _COS_LUT[bank_idx] * line_len
+        dy = _SIN_LUT[bank_idx] * line_len
+        coords(self.horizon_id, cx - dx, horizon_y - dy, cx + dx, horizon_y + dy)
 
         # Runway cue appears when close
-        if s.distance_nm < 8:
+        near = s.distance_nm < 8
+        if near:
             rw_w = max(30, int(280 * (8 - s.distance_nm) / 8))
             rw_h = max(20, int(140 * (8 - s.distance_nm) / 8))
             rcy = horizon_y + 140
-            c.create_polygon(
+            coords(
+                self.runway_id,
                 cx - rw_w,
                 rcy + rw_h,
                 cx + rw_w,
@@ -283,13 +993,10 @@ class VisualFlightSim:
                 rcy,
                 cx - rw_w // 3,
                 rcy,
-                fill="#2f2f2f",
-                outline="white",
             )
-
-        # Aircraft reference symbol
-        c.create_line(cx - 50, cy, cx + 50, cy, fill="#00ff66", width=3)
-        c.create_line(cx, cy - 15, cx, cy + 15, fill="#00ff66", width=3)
+        if near != self._runway_shown:
+            self._runway_shown = near
+            itemconfig(self.runway_id, state="normal" if near else "hidden")
 
         # HUD text
         warn = ""
@@ -298,54 +1005,143 @@ class VisualFlightSim:
         elif s.smoke_level > 1.1:
             warn = " HEAVY SMOKE"
 
-        c.create_text(
-            15,
-            15,
-            anchor="nw",
-            fill="white",
-            font=("Consolas", 14, "bold"),
-            text=(
-                f"SPD {int(s.speed_kts):03d}kt   ALT {int(s.altitude_ft):05d}ft   "
-                f"HDG {int(s.heading_deg):03d}   DIST {s.distance_nm:04.1f}nm{warn}"
+        itemconfig(
+            self.hud_main_id,
+            text=_HUD_MAIN_FMT.format(
+                int(s.speed_kts), int(s.altitude_ft), int(s.heading_deg), s.distance_nm, warn
             ),
         )
-        c.create_text(
-            15,
-            42,
-            anchor="nw",
-            fill="#d7f0ff",
-            font=("Consolas", 12),
-            text=(
-                f"THR {int(s.throttle):02d}%  PITCH {s.pitch_deg:+.1f}°  BANK {s.bank_deg:+.1f}°  "
-                f"FLAPS {s.flaps}  GEAR {'DOWN' if s.gear_down else 'UP'}  O2 {'ON' if s.oxygen_on else 'OFF'}"
+        itemconfig(
+            self.hud_config_id,
+            text=_HUD_CONFIG_FMT.format(
+                int(s.throttle),
+                s.pitch_deg,
+                s.bank_deg,
+                s.flaps,
+                "DOWN" if s.gear_down else "UP",
+                "ON" if s.oxygen_on else "OFF",
             ),
         )
 
-        c.create_text(15, h - 45, anchor="nw", fill="#9cc0d8", font=("Consolas", 11), text=self.info)
-        c.create_text(15, h - 24, anchor="nw", fill="#fff7a8", font=("Consolas", 11), text=f"MSG: {s.message}")
+        itemconfig(self.message_id, text=f"MSG: {s.message}")
 
         # End overlay
         if s.game_over:
             overlay = "SUCCESSFUL EMERGENCY LANDING" if s.landed else "FLIGHT LOST"
-            c.create_rectangle(0, 0, w, h, fill="#000000", stipple="gray50", outline="")
-            c.create_text(cx, cy - 20, fill="white", font=("Consolas", 30, "bold"), text=overlay)
+            c.create_rectangle(0, 0, w, h, fill="#000000", stipple="gray50", outline="", tags="transient")
+            c.create_text(
+                cx, cy - 20, fill="white", font=self.font_overlay, text=overlay, tags="transient"
+            )
             c.create_text(
                 cx,
                 cy + 20,
                 fill="#f5f5f5",
-                font=("Consolas", 16),
+                font=self.font_score,
                 text=f"Score: {s.score} | Time: {int(s.time_s)}s | Press Q to quit",
+                tags="transient",
             )
 
+    def _render_horizon(self, w: int, h: int) -> tk.PhotoImage:
+        # Sky over ground, each h + _HORIZON_PAD tall, so the canvas stays covered at any
+        # pitch. Scrolling it vertically is the pitch cue.
+        split = h + _HORIZON_PAD
+        img = tk.PhotoImage(master=self.root, width=w, height=2 * split)
+        img.put("#4b87d8", to=(0, 0, w, split))
+        img.put("#6b4f2f", to=(0, split, w, 2 * split))
+        return img
+
+    def _layout(self) -> None:
+        # Items that only depend on the canvas size, placed at startup and on <Configure>.
+        c = self.canvas
+        w = self._w
+        h = self._h
+        cx = w // 2
+        cy = h // 2
+        c.coords(self.cross_h_id, cx - 50, cy, cx + 50, cy)
+        c.coords(self.cross_v_id, cx, cy - 15, cx, cy + 15)
+        c.coords(self.controls_id, 15, h - 45)
+        c.coords(self.message_id, 15, h - 24)
+
+    def _on_resize(self, event: tk.Event) -> None:
+        if (event.width, event.height) != (self._w, self._h):
+            self._w = event.width
+            self._h = event.height
+            self._horizon_img = self._render_horizon(self._w, self._h)
+            self.canvas.itemconfig(self.horizon_img_id, image=self._horizon_img)
+            self._layout()
+        self.dirty = True
+
+    def _hud_tuple(self) -> tuple:
+        # Everything draw() renders; when this is unchanged the frame would be identical.
+        s = self.state
+        st = s.record
+        return (
+            int(st[IDX_SPD]),
+            int(st[IDX_ALT]),
+            int(st[IDX_HDG]),
+            int(st[IDX_DIST] * 100),
+            st[IDX_THR],
+            st[IDX_PITCH],
+            st[IDX_BANK],
+            int(st[IDX_FLAPS]),
+            int(st[IDX_FLAGS]) & _HUD_FLAGS,
+            st[IDX_SMOKE] > 1.1,
+            s.message,
+        )
+
     def loop(self) -> None:
         if not self.running:
             return
 
         self.core.step(0.1)
-        self.draw()
+        hud = self._hud_tuple()
+        if hud != self._last_hud_tuple:
+            self._last_hud_tuple = hud
+            self.dirty = True
+        # While minimized/unmapped the frame stays dirty and is drawn once visible again.
+        if self.dirty and self.canvas.winfo_viewable():
+            self.dirty = False
+            self.root.after_idle(self.draw)
         self.root.after(100, self.loop)
 
 
+def replay(
+    core: SimulatorCore,
+    ticks: Iterable[Iterable[str]],
+    dt: float = 0.1,
+    verbose: bool = False,
+) -> FlightState:
+    """Drive ``core`` from a recorded trace: the keysyms pressed before each tick."""
+    s = core.state
+    st = s.record
+    handlers = _KEY_HANDLERS
+    lines = []
+    for keys in ticks:
+        for k in keys:
+            handler = handlers.get(k.lower())
+            if handler is not None:
+                handler(core)
+        core.step(dt)
+        flags = int(st[IDX_FLAGS])
+        if verbose:
+            lines.append(
+                _STATUS_FMT.format(
+                    st[IDX_TIME],
+                    st[IDX_ALT],
+                    st[IDX_SPD],
+                    st[IDX_DIST],
+                    bool(flags & FLAG_FIRE),
+                    s.message,
+                )
+            )
+        if flags & FLAG_OVER:
+            break
+    if lines:
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+    return s
+
+
 def run_text_demo(seconds: int = 20) -> None:
     """Headless demo mode for environments without GUI."""
     sim = SimulatorCore()
@@ -353,31 +1149,25 @@ def run_text_demo(seconds: int = 20) -> None:
 
     # Autopilot-ish setup so CI/headless can validate core logic
     s.emergency_declared = True
-    for i in range(seconds * 10):
-        if s.time_s > 52 and s.engine2_on:
-            sim.command_shutdown_engine2()
-            sim.command_fire_bottle()
-        if s.altitude_ft > 3000:
-            s.pitch_deg = -4
-            s.throttle = 50
-        else:
-            s.pitch_deg = -1
-            s.throttle = 45
-            s.flaps = 2
-            s.gear_down = True
-        sim.step(0.1)
-        if s.game_over:
-            break
-        if i % 20 == 0:
-            print(
-                f"t={s.time_s:5.1f}s alt={s.altitude_ft:7.0f}ft spd={s.speed_kts:6.1f}kt "
-                f"dist={s.distance_nm:5.2f}nm fire={s.engine2_fire} msg={s.message}"
-            )
-
-    print(
+    steps = seconds * 10
+    log_len = max(0, steps // 20 + 1) * _DEMO_LOG_COLS
+    log = _float_buffer(log_len)
+    rows, msg = _run_demo_jit(s.record, steps, 0.1, sim.airport_heading, log)
+    if msg:
+        s.message = _MESSAGES[msg]
+
+    # Format everything after the run so the trajectory loop stays pure compute.
+    lines = []
+    for base in range(0, rows * _DEMO_LOG_COLS, _DEMO_LOG_COLS):
+        row = log[base : base + _DEMO_LOG_COLS]
+        t, alt, spd, dist, fire, code = row
+        lines.append(_STATUS_FMT.format(t, alt, spd, dist, bool(fire), _MESSAGES[int(code)]))
+    lines.append(
         f"END landed={s.landed} lost={s.game_over and not s.landed} "
         f"score={s.score} alt={s.altitude_ft:.0f} dist={s.distance_nm:.2f}"
     )
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
 
 def main() -> None:
@@ -391,7 +1181,7 @@ def main() -> None:
         return
 
     if tk is None:
-        print("Tkinter is not available in this environment. Try: python3 flight_simulator.py --demo")
+        sys.stdout.write(_NO_TK_TEXT)
         return
 
     root = tk.Tk()
@@ -0,0 +1,15 @@
+"""Build flight_simulator as a native extension module.
+
+    python setup.py build_ext --inplace
+
+Compiler directives live in the header of flight_simulator.py and C types in
+flight_simulator.pxd, so the plain .py module keeps running unchanged.
+"""
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="flight-simulator",
+    ext_modules=cythonize(["flight_simulator.py"], nthreads=4),
+)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Cross-check the copies of the flight physics against each other.
+
+The physics lives in three places (the ``_step_core`` record kernel, the fused
+``_step_fleet`` kernel and the ``_step_fleet_numpy`` array passes) and runs in
+three modes (interpreted, Numba, Cython). This script replays the headless demo
+against a recorded baseline, then advances random flights through
+SimulatorCore.step and both fleet paths and compares every column.
+
+Run it once per mode after touching the physics:
+
+    python tools/check_parity.py                 # Numba, if installed
+    python tools/check_parity.py --no-numba      # interpreted
+    python setup.py build_ext --inplace && python tools/check_parity.py   # Cython
+
+Re-record the baseline with --record only for an intentional behaviour change.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(HERE, "demo_400s.txt")
+DEMO_SECONDS = 400
+# Fleet paths may round differently from the scalar kernel (array modulo vs. wrap).
+REL_TOL = 1e-12
+
+
+def _random_core(fs, rng: random.Random, i: int):
+    core = fs.SimulatorCore()
+    s = core.state
+    s.distance_nm = rng.uniform(1, 12)
+    s.altitude_ft = rng.uniform(100, 3000)
+    s.speed_kts = rng.uniform(120, 200)
+    s.throttle = rng.uniform(20, 80)
+    s.pitch_deg = rng.uniform(-5, 3)
+    s.bank_deg = rng.uniform(-5, 5)
+    s.heading_deg = rng.uniform(240, 300)
+    s.flaps = rng.randint(0, 3)
+    s.gear_down = rng.random() < 0.7
+    s.oxygen_on = rng.random() < 0.5
+    s.emergency_declared = rng.random() < 0.5
+    s.engine1_on = i % 3 != 0
+    s.engine2_on = i % 5 != 0
+    if i % 4 == 1:
+        # Short final, so some flights land and others crash on the runway.
+        s.distance_nm = rng.uniform(0.3, 1.0)
+        s.altitude_ft = rng.uniform(40, 200)
+        s.speed_kts = rng.uniform(130, 170)
+        s.heading_deg = rng.uniform(255, 285)
+        s.flaps = 2
+        s.gear_down = True
+        s.bank_deg = 0.0
+        s.pitch_deg = -1.0
+        s.throttle = 45.0
+    return core
+
+
+def _same(a, b) -> bool:
+    if isinstance(a, float):
+        return abs(a - b) <= REL_TOL * max(1.0, abs(a))
+    return a == b
+
+
+def check_demo(fs, record: bool) -> bool:
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        fs.run_text_demo(DEMO_SECONDS)
+    text = out.getvalue()
+    if record:
+        with open(BASELINE, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        print(f"demo: recorded {BASELINE}")
+        return True
+    with open(BASELINE, encoding="utf-8") as fh:
+        expected = fh.read()
+    if text == expected:
+        print(f"demo: {DEMO_SECONDS}s output matches baseline")
+        return True
+    for n, (got, want) in enumerate(zip(text.splitlines(), expected.splitlines()), 1):
+        if got != want:
+            print(f"demo: line {n} differs\n  want: {want}\n  got:  {got}")
+            break
+    else:
+        print("demo: output length differs from baseline")
+    return False
+
+
+def check_fleet(fs, flights: int, ticks: int, seed: int) -> bool:
+    if fs.np is None:
+        print("fleet: skipped, NumPy is not installed")
+        return True
+    rng = random.Random(seed)
+    cores = [_random_core(fs, rng, i) for i in range(flights)]
+    states = [c.state for c in cores]
+    paths = {
+        "step_fleet": (fs.FleetState.from_states(states), fs.step_fleet),
+        "numpy": (fs.FleetState.from_states(states), fs._step_fleet_numpy),
+    }
+    for _ in range(ticks):
+        for core in cores:
+            core.step(0.1)
+        for fleet, step in paths.values():
+            step(fleet, 0.1, 270.0)
+
+    ok = True
+    landed = sum(s.landed for s in states)
+    for name, (fleet, _) in paths.items():
+        bad = 0
+        for i, s in enumerate(states):
+            t = fleet.state(i)
+            for col in fs.FleetState._COLUMNS:
+                a, b = getattr(s, col), getattr(t, col)
+                if not _same(a, b):
+                    if bad < 5:
+                        print(f"fleet/{name}: flight {i} {col}: step={a!r} fleet={b!r}")
+                    bad += 1
+        print(f"fleet/{name}: {flights} flights x {ticks} ticks, {bad} mismatches ({landed} landed)")
+        ok = ok and bad == 0
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--no-numba", action="store_true", help="hide Numba to test the interpreted path")
+    parser.add_argument("--record", action="store_true", help="rewrite the demo baseline")
+    parser.add_argument("--flights", type=int, default=300)
+    parser.add_argument("--ticks", type=int, default=2500)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.no_numba:
+        sys.modules["numba"] = None
+    sys.path.insert(0, os.path.dirname(HERE))
+    import flight_simulator as fs
+
+    mode = "cython" if fs.COMPILED else "numba" if fs._STEP_JIT else "interpreted"
+    print(f"mode: {mode} ({fs.__file__})")
+    ok = check_demo(fs, args.record)
+    ok = check_fleet(fs, args.flights, args.ticks, args.seed) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())